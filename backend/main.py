@@ -1,8 +1,9 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 import uuid
 import os
 import json
@@ -19,6 +20,7 @@ logger = logging.getLogger(__name__)
 
 from services.openai_service import OpenAIService
 from services.image_service import ImageService
+from services.export_service import ExportService
 
 app = FastAPI(
     title="LP Analysis API",
@@ -65,6 +67,10 @@ class AnalysisStartRequest(BaseModel):
     session_id: str
     performance_data: Optional[PerformanceData] = None
 
+class ExportRequest(BaseModel):
+    session_ids: Optional[List[str]] = None  # 未指定なら完了済みの全セッション
+    format: Literal["zip", "ndjson"] = "zip"
+
 # API Endpoints
 
 @app.get("/")
@@ -267,6 +273,54 @@ async def get_analysis_results(session_id: str):
         "completed_at": session.get("completed_at")
     }
 
+# Export
+def _export_response(session_ids: List[str], export_format: str, name: str) -> StreamingResponse:
+    export_service = ExportService(analysis_sessions)
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    
+    if export_format == "ndjson":
+        body = export_service.stream_ndjson(session_ids)
+        media_type = "application/x-ndjson"
+        filename = f"{name}_{timestamp}.ndjson"
+    else:
+        body = export_service.stream_zip(session_ids)
+        media_type = "application/zip"
+        filename = f"{name}_{timestamp}.zip"
+    
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@app.post("/api/export")
+async def export_analyses(request: ExportRequest):
+    if request.session_ids is None:
+        session_ids = [
+            session_id for session_id, session in analysis_sessions.items()
+            if session["status"] == "completed"
+        ]
+    else:
+        session_ids = list(dict.fromkeys(request.session_ids))
+        for session_id in session_ids:
+            if session_id not in analysis_sessions:
+                raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
+            if analysis_sessions[session_id]["status"] != "completed":
+                raise HTTPException(status_code=400, detail=f"Analysis not completed: {session_id}")
+    
+    logger.info(f"Exporting {len(session_ids)} sessions as {request.format}")
+    return _export_response(session_ids, request.format, "lp_analysis_export")
+
+@app.get("/api/analysis/{session_id}/export")
+async def export_analysis(session_id: str, format: Literal["zip", "ndjson"] = "zip"):
+    if session_id not in analysis_sessions:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    if analysis_sessions[session_id]["status"] != "completed":
+        raise HTTPException(status_code=400, detail="Analysis not completed")
+    
+    return _export_response([session_id], format, f"lp_analysis_{session_id}")
+
 # Background Analysis Task
 async def perform_analysis(session_id: str, api_key: str):
     logger.info(f"Background analysis started for session: {session_id}")
@@ -0,0 +1,127 @@
+import os
+import json
+import zipfile
+from datetime import datetime
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+
+class _ChunkSink:
+    """ZipFileの書き込み先（書いたバイト列を溜めておき、都度取り出す）"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        yield from chunks
+
+
+class ExportService:
+    """分析結果のエクスポート（ZIP / NDJSON をストリーミング生成）"""
+
+    def __init__(self, sessions: Dict[str, Dict[str, Any]]):
+        self.sessions = sessions
+        self.upload_dir = "uploads"
+        self.chunk_size = 64 * 1024  # 64KB
+        self.image_keys = ["image_a", "image_b"]
+
+    def _json_default(self, value: Any) -> Any:
+        """JSONシリアライズできない値の変換"""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
+
+    def _dumps(self, data: Any, indent: Optional[int] = None) -> bytes:
+        return json.dumps(
+            data, ensure_ascii=False, indent=indent, default=self._json_default
+        ).encode("utf-8")
+
+    def _session_record(self, session: Dict[str, Any]) -> Dict[str, Any]:
+        """エクスポート対象の項目のみ抽出（API keyなどは含めない）"""
+        return {
+            "session_id": session["id"],
+            "title": session.get("title"),
+            "description": session.get("description"),
+            "created_at": session.get("created_at"),
+            "completed_at": session.get("completed_at"),
+            "results": session.get("results"),
+        }
+
+    def _image_path(self, filename: Optional[str]) -> Optional[str]:
+        if not filename:
+            return None
+        path = os.path.join(self.upload_dir, os.path.basename(filename))
+        return path if os.path.isfile(path) else None
+
+    def _iter_sessions(self, session_ids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """セッションを1件ずつ取得（途中で削除されたものはスキップ）"""
+        for session_id in session_ids:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                yield session
+
+    def stream_ndjson(self, session_ids: Iterable[str]) -> Iterator[bytes]:
+        """1セッション1行のNDJSONを生成（画像はURL参照）"""
+        for session in self._iter_sessions(session_ids):
+            record = self._session_record(session)
+            record["performance_data"] = session.get("performance_data")
+            record["images"] = {
+                key: f"/uploads/{session[f'{key}_filename']}"
+                for key in self.image_keys
+                if self._image_path(session.get(f"{key}_filename"))
+            }
+            yield self._dumps(record) + b"\n"
+
+    def stream_zip(self, session_ids: Iterable[str]) -> Iterator[bytes]:
+        """セッションごとのディレクトリを持つZIPを逐次生成"""
+        sink = _ChunkSink()
+        # シーク不可の書き込み先なので、ZipFileはデータディスクリプタ方式で出力する
+        with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for session in self._iter_sessions(session_ids):
+                prefix = session["id"]
+
+                archive.writestr(
+                    f"{prefix}/results.json",
+                    self._dumps(self._session_record(session), indent=2),
+                )
+                yield from sink.drain()
+
+                archive.writestr(
+                    f"{prefix}/performance_data.json",
+                    self._dumps(session.get("performance_data"), indent=2),
+                )
+                yield from sink.drain()
+
+                for key in self.image_keys:
+                    filename = session.get(f"{key}_filename")
+                    image_path = self._image_path(filename)
+                    if not image_path:
+                        continue
+                    yield from self._write_file(
+                        archive, sink, image_path, f"{prefix}/{key}{os.path.splitext(filename)[1]}"
+                    )
+        # セントラルディレクトリ
+        yield from sink.drain()
+
+    def _write_file(
+        self, archive: zipfile.ZipFile, sink: _ChunkSink, path: str, arcname: str
+    ) -> Iterator[bytes]:
+        """ファイルをチャンク単位でZIPに書き込む（JPEGは圧縮済みなので無圧縮）"""
+        info = zipfile.ZipInfo.from_file(path, arcname)
+        info.compress_type = zipfile.ZIP_STORED
+        with open(path, "rb") as source, archive.open(info, mode="w") as entry:
+            while True:
+                chunk = source.read(self.chunk_size)
+                if not chunk:
+                    break
+                entry.write(chunk)
+                yield from sink.drain()
+        yield from sink.drain()